@@ -2,17 +2,23 @@
 Command Line Interface for Group Load Kafka Tool
 """
 import logging
+import os
+import queue
 import sys
-from typing import Optional
+import threading
+from functools import partial
+from typing import Callable, Iterator, List, Optional
 import click
+import ijson
+import orjson
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from config import config
 from kafka_producer import GroupLoadStreamer
-from sample_data import GroupDataGenerator, SAMPLE_GROUPS
-from models import GroupDetails
+from sample_data import GroupDataGenerator, SAMPLE_GROUPS, create_generator_pool
+from models import GroupDetails, GROUPS_ADAPTER
 
 
 # Setup logging
@@ -23,6 +29,10 @@ logging.basicConfig(
 
 console = Console()
 
+# Generated groups buffered ahead of the producer in send-sample
+PIPELINE_QUEUE_SIZE = 1000
+PIPELINE_CHUNK_SIZE = 100
+
 
 @click.group()
 @click.option('--environment', '-e', 
@@ -42,6 +52,9 @@ def cli(ctx, environment, verbose):
     
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
+    else:
+        # Per-message producer logging is only shown with --verbose
+        logging.getLogger("kafka_producer").setLevel(logging.WARNING)
     
     console.print(f"[bold blue]Group Load Kafka Tool[/bold blue]")
     console.print(f"Environment: [green]{environment}[/green]")
@@ -53,15 +66,22 @@ def cli(ctx, environment, verbose):
 @click.option('--corporate', is_flag=True, help='Generate corporate group data')
 @click.option('--company-name', help='Company name for corporate group')
 @click.option('--employees', default=10, help='Number of employees for corporate group')
+@click.option('--parallel', is_flag=True, help='Generate groups across multiple processes')
 @click.pass_context
-def send_sample(ctx, count, corporate, company_name, employees):
+def send_sample(ctx, count, corporate, company_name, employees, parallel):
     """Send sample group data to Kafka"""
     console.print(f"[bold]Sending {count} sample group(s) to Kafka...[/bold]")
     
-    streamer = GroupLoadStreamer()
+    executor = None
+    streamer = None
     generator = GroupDataGenerator()
     
     try:
+        # Start generator processes before the producer's threads exist
+        if parallel and not corporate:
+            executor = create_generator_pool()
+        streamer = GroupLoadStreamer()
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -76,7 +96,7 @@ def send_sample(ctx, count, corporate, company_name, employees):
                 group = generator.generate_corporate_group(company_name, employees)
                 progress.update(task, description="Sending corporate group to Kafka...")
                 
-                success = streamer.stream_group_data(group.model_dump())
+                success = streamer.stream_group_model(group)
                 if success:
                     console.print(f"[green]✓[/green] Corporate group sent successfully")
                     console.print(f"Group ID: [blue]{group.group_id}[/blue]")
@@ -85,25 +105,68 @@ def send_sample(ctx, count, corporate, company_name, employees):
                     console.print(f"[red]✗[/red] Failed to send corporate group")
                     sys.exit(1)
             else:
-                task = progress.add_task("Generating sample groups...", total=count)
-                groups = generator.generate_batch_groups(count)
+                task = progress.add_task("Generating and sending groups to Kafka...", total=count)
+                if parallel:
+                    generate_batch = partial(generator.generate_batch_groups_parallel, executor=executor)
+                    chunk_size = PIPELINE_CHUNK_SIZE * (os.cpu_count() or 1)
+                else:
+                    generate_batch = generator.generate_batch_groups
+                    chunk_size = PIPELINE_CHUNK_SIZE
                 
-                progress.update(task, description="Sending groups to Kafka...")
-                results = streamer.stream_batch_data([group.model_dump() for group in groups])
+                # Generation runs in a background thread so it overlaps with sending
+                groups = _generate_groups_pipelined(generate_batch, count, chunk_size)
+                results = streamer.stream_batch_data_models(groups)
                 
                 # Display results
-                success_count = sum(1 for success in results.values() if success)
-                console.print(f"[green]✓[/green] Successfully sent {success_count}/{count} groups")
+                success_count = sum(1 for _, success in results if success)
+                console.print(f"[green]✓[/green] Successfully sent {success_count}/{len(results)} groups")
                 
-                if success_count < count:
-                    failed_groups = [group_id for group_id, success in results.items() if not success]
+                if success_count < len(results):
+                    failed_groups = [group_id for group_id, success in results if not success]
                     console.print(f"[red]✗[/red] Failed groups: {', '.join(failed_groups)}")
     
     except Exception as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         sys.exit(1)
     finally:
-        streamer.close()
+        if streamer is not None:
+            streamer.close()
+        if executor is not None:
+            executor.shutdown()
+
+
+def _generate_groups_pipelined(generate_batch: Callable[[int], List[GroupDetails]],
+                               count: int, chunk_size: int) -> Iterator[GroupDetails]:
+    """
+    Yield generated groups while a background thread keeps generating ahead
+    
+    Groups are passed through a bounded queue, so at most
+    PIPELINE_QUEUE_SIZE generated groups wait to be sent at any time.
+    """
+    groups: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    errors = []
+    
+    def fill_queue():
+        try:
+            remaining = count
+            while remaining > 0:
+                batch_size = min(remaining, chunk_size)
+                for group in generate_batch(batch_size):
+                    groups.put(group)
+                remaining -= batch_size
+        except Exception as e:
+            errors.append(e)
+        finally:
+            groups.put(None)
+    
+    thread = threading.Thread(target=fill_queue, name="group-generator", daemon=True)
+    thread.start()
+    
+    yield from iter(groups.get, None)
+    
+    thread.join()
+    if errors:
+        raise errors[0]
 
 
 @cli.command()
@@ -111,44 +174,52 @@ def send_sample(ctx, count, corporate, company_name, employees):
 @click.pass_context
 def send_file(ctx, file_path):
     """Send group data from JSON file to Kafka"""
-    import json
-    
     console.print(f"[bold]Sending group data from {file_path}...[/bold]")
     
-    streamer = GroupLoadStreamer()
+    streamer = None
     
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        # Handle single group or list of groups
-        if isinstance(data, dict):
-            groups = [data]
-        else:
-            groups = data
+        streamer = GroupLoadStreamer()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Sending groups to Kafka...", total=len(groups))
-            
-            results = streamer.stream_batch_data(groups)
-            
-            # Display results
-            success_count = sum(1 for success in results.values() if success)
-            console.print(f"[green]✓[/green] Successfully sent {success_count}/{len(groups)} groups")
+        with open(file_path, 'rb') as f:
+            # Stream arrays of groups item by item; a single group is loaded eagerly
+            if _json_root_char(f) == b'[':
+                groups = ijson.items(f, 'item', use_float=True)
+            else:
+                groups = [orjson.loads(f.read())]
             
-            if success_count < len(groups):
-                failed_groups = [group_id for group_id, success in results.items() if not success]
-                console.print(f"[red]✗[/red] Failed groups: {', '.join(failed_groups)}")
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            ) as progress:
+                task = progress.add_task("Sending groups to Kafka...", total=None)
+                
+                results = streamer.stream_batch_data(groups)
+                
+                # Display results, one entry per group read from the file
+                success_count = sum(1 for _, success in results if success)
+                console.print(f"[green]✓[/green] Successfully sent {success_count}/{len(results)} groups")
+                
+                if success_count < len(results):
+                    failed_groups = [group_id for group_id, success in results if not success]
+                    console.print(f"[red]✗[/red] Failed groups: {', '.join(failed_groups)}")
     
     except Exception as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         sys.exit(1)
     finally:
-        streamer.close()
+        if streamer is not None:
+            streamer.close()
+
+
+def _json_root_char(f) -> bytes:
+    """Return the first non-whitespace byte of a JSON file and rewind it"""
+    char = f.read(1)
+    while char.isspace():
+        char = f.read(1)
+    f.seek(0)
+    return char
 
 
 @cli.command()
@@ -162,6 +233,7 @@ def config_info(ctx):
     table.add_row("Environment", config.environment)
     table.add_row("Bootstrap Servers", config.bootstrap_servers)
     table.add_row("API Key", config.api_key[:8] + "..." if config.api_key else "Not set")
+    table.add_row("API Secret", "********" if config.api_secret else "Not set")
     table.add_row("Current Topic", config.current_topic)
     table.add_row("Dev Topic", config.dev_topic)
     table.add_row("QA Topic", config.qa_topic)
@@ -175,7 +247,8 @@ def config_info(ctx):
 @click.option('--corporate', is_flag=True, help='Generate corporate group data')
 @click.option('--company-name', help='Company name for corporate group')
 @click.option('--employees', default=25, help='Number of employees for corporate group')
-def generate_data(output, count, corporate, company_name, employees):
+@click.option('--parallel', is_flag=True, help='Generate groups across multiple processes')
+def generate_data(output, count, corporate, company_name, employees, parallel):
     """Generate sample group data (without sending to Kafka)"""
     generator = GroupDataGenerator()
     
@@ -183,20 +256,20 @@ def generate_data(output, count, corporate, company_name, employees):
         if not company_name:
             company_name = "Sample Corporation"
         
-        group = generator.generate_corporate_group(company_name, employees)
-        data = [group.model_dump()]
+        groups = [generator.generate_corporate_group(company_name, employees)]
+        data_json = GROUPS_ADAPTER.dump_json(groups, indent=2)
+    elif parallel:
+        data_json = generator.generate_batch_groups_parallel_json(count, indent=2)
     else:
         groups = generator.generate_batch_groups(count)
-        data = [group.model_dump() for group in groups]
+        data_json = GROUPS_ADAPTER.dump_json(groups, indent=2)
     
     if output:
-        import json
-        with open(output, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(output, 'wb') as f:
+            f.write(data_json)
         console.print(f"[green]✓[/green] Generated data saved to {output}")
     else:
-        import json
-        console.print(json.dumps(data, indent=2, default=str))
+        console.print(data_json.decode('utf-8'))
 
 
 if __name__ == '__main__':
@@ -2,12 +2,14 @@
 Configuration management for Kafka Group Load Tool
 """
 import os
-from typing import Literal
-from pydantic import BaseSettings, Field
+from typing import Literal, Optional
+from pydantic import Field, SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class KafkaConfig(BaseSettings):
     """Kafka configuration settings"""
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
     
     # Kafka connection settings
     bootstrap_servers: str = Field(
@@ -18,9 +20,9 @@ class KafkaConfig(BaseSettings):
         default="SY367CYSVPCVDNXJ",
         description="Kafka API key"
     )
-    api_secret: str = Field(
-        default="Zyqm1BIID+G8/426QP6FNIYw/bl6kgolKbpnlh6nyZ9c+JcC/Qnt9bGXQDsb/wvQ",
-        description="Kafka API secret"
+    api_secret: Optional[SecretStr] = Field(
+        default=None,
+        description="Kafka API secret (environment or .env only, required to produce)"
     )
     
     # Environment settings
@@ -39,6 +41,32 @@ class KafkaConfig(BaseSettings):
         description="QA Kafka topic"
     )
     
+    # Producer tuning (librdkafka)
+    acks: Literal["all", "1", "0"] = Field(
+        default="all",
+        description="Broker acknowledgements required (use 1 for faster, less durable non-prod loads)"
+    )
+    batch_size: int = Field(
+        default=131072,
+        description="Maximum size in bytes of a produce request batch"
+    )
+    linger_ms: int = Field(
+        default=50,
+        description="Time in ms to wait for a batch to fill before sending"
+    )
+    compression_type: Literal["none", "gzip", "snappy", "lz4", "zstd"] = Field(
+        default="lz4",
+        description="Compression codec for produced batches"
+    )
+    queue_buffering_max_messages: int = Field(
+        default=1_000_000,
+        description="Maximum number of messages in the local producer queue"
+    )
+    queue_buffering_max_kbytes: int = Field(
+        default=1_048_576,
+        description="Maximum size in KB of the local producer queue"
+    )
+    
     @property
     def current_topic(self) -> str:
         """Get the current topic based on environment"""
@@ -46,23 +74,33 @@ class KafkaConfig(BaseSettings):
     
     @property
     def kafka_config(self) -> dict:
-        """Get Kafka producer configuration"""
+        """
+        Get Kafka producer configuration
+        
+        Raises:
+            ValueError: If no API secret has been configured
+        """
+        if self.api_secret is None:
+            raise ValueError("Kafka API secret is not set; set API_SECRET in the environment or .env")
+        
         return {
             'bootstrap.servers': self.bootstrap_servers,
             'security.protocol': 'SASL_SSL',
             'sasl.mechanism': 'PLAIN',
             'sasl.username': self.api_key,
-            'sasl.password': self.api_secret,
-            'acks': 'all',
+            'sasl.password': self.api_secret.get_secret_value(),
+            'acks': self.acks,
             'retries': 3,
-            'batch.size': 16384,
-            'linger.ms': 10,
-            'buffer.memory': 33554432,
+            'batch.size': self.batch_size,
+            'linger.ms': self.linger_ms,
+            'compression.type': self.compression_type,
+            'queue.buffering.max.messages': self.queue_buffering_max_messages,
+            'queue.buffering.max.kbytes': self.queue_buffering_max_kbytes,
+            # Idempotence requires acks=all
+            'enable.idempotence': self.acks == 'all',
+            'max.in.flight.requests.per.connection': 5,
+            'socket.nagle.disable': True,
         }
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
 
 
 # Global config instance
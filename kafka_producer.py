@@ -1,99 +1,207 @@
 """
 Kafka Producer for Group Load Tool
 """
+import atexit
 import logging
-import uuid
-from typing import Optional, Dict, Any
+import threading
+from datetime import datetime
+from functools import partial
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from confluent_kafka import Producer, KafkaError
 from confluent_kafka.serialization import SerializationContext, MessageField
 from confluent_kafka.schema_registry import SchemaRegistryClient
 from confluent_kafka.schema_registry.json_schema import JSONSerializer
+from ulid import ULID
 
 from config import config
 from models import GroupLoadMessage, GroupDetails
 
 
+# Process-wide producer shared by all GroupLoadKafkaProducer instances
+_producer_singleton: Optional[Producer] = None
+_producer_lock = threading.Lock()
+
+# Background thread serving delivery reports for the shared producer
+_poll_thread: Optional[threading.Thread] = None
+_poll_stop = threading.Event()
+
+
+def get_shared_producer(producer_config: Dict[str, Any]) -> Producer:
+    """
+    Get the process-wide Kafka producer, creating it on first use
+    
+    The producer (and its broker connections) is reused by every
+    GroupLoadKafkaProducer in the process. A background thread polls it
+    for delivery reports, so callers can enqueue without ever blocking.
+    It is stopped and the producer flushed at interpreter exit.
+    
+    Args:
+        producer_config: librdkafka configuration used on first creation
+        
+    Returns:
+        Producer: The shared confluent_kafka Producer
+    """
+    global _producer_singleton, _poll_thread
+    
+    with _producer_lock:
+        if _producer_singleton is None:
+            _producer_singleton = Producer(producer_config)
+            _poll_thread = threading.Thread(
+                target=_poll_loop,
+                args=(_producer_singleton,),
+                name="kafka-producer-poll",
+                daemon=True
+            )
+            _poll_thread.start()
+            atexit.register(_close_shared_producer)
+        return _producer_singleton
+
+
+def _poll_loop(producer: Producer):
+    """Serve delivery callbacks until the shared producer is closed"""
+    while not _poll_stop.is_set():
+        producer.poll(0.1)
+
+
+def _close_shared_producer():
+    """Stop the poll thread and flush any messages still queued"""
+    _poll_stop.set()
+    if _poll_thread is not None:
+        _poll_thread.join()
+    if _producer_singleton is not None:
+        _producer_singleton.flush()
+
+
 class GroupLoadKafkaProducer:
     """Kafka producer for group load messages"""
     
     def __init__(self):
         """Initialize the Kafka producer"""
-        self.producer = Producer(config.kafka_config)
+        self.producer = get_shared_producer(config.kafka_config)
         self.topic = config.current_topic
         self.logger = logging.getLogger(__name__)
+        # Delivery status of tracked message_ids, updated by _delivery_callback
+        self._delivery_results: Dict[str, bool] = {}
         
     def produce_group_message(self, group_details: GroupDetails, 
                             message_id: Optional[str] = None) -> bool:
         """
-        Produce a group load message to Kafka
+        Queue a group load message for Kafka
         
         Args:
             group_details: GroupDetails object to send
-            message_id: Optional message ID, will generate if not provided
+            message_id: Optional message ID, a time-ordered ULID is generated if not provided
             
         Returns:
             bool: True if message was queued successfully, False otherwise
+            
+        Note:
+            Queuing does not mean delivery. The message is not flushed; use
+            produce_batch_messages to wait for and check delivery.
         """
         try:
             if not message_id:
-                message_id = str(uuid.uuid4())
-            
-            # Create the message wrapper
-            message = GroupLoadMessage(
-                environment=config.environment,
-                group_details=group_details,
-                message_id=message_id
-            )
-            
-            # Convert to JSON
-            message_json = message.to_kafka_message()
-            
-            # Produce to Kafka
-            self.producer.produce(
-                topic=self.topic,
-                value=message_json.encode('utf-8'),
-                key=message_id.encode('utf-8'),
-                callback=self._delivery_callback
-            )
+                message_id = str(ULID())
             
-            # Flush to ensure message is sent
-            self.producer.flush(timeout=10)
+            self.produce_group_message_async(group_details, message_id)
             
-            self.logger.info(f"Successfully produced message {message_id} to topic {self.topic}")
+            self.logger.info("Queued message %s for topic %s", message_id, self.topic)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to produce message: {str(e)}")
+            self.logger.error("Failed to queue message: %s", e)
             return False
     
-    def produce_batch_messages(self, group_details_list: list[GroupDetails]) -> Dict[str, bool]:
+    def produce_group_message_async(self, group_details: GroupDetails, message_id: str) -> None:
+        """
+        Enqueue a group load message without waiting for delivery
+        
+        Messages are keyed by group_id, so every message for a group lands
+        on the same partition. The delivery outcome is recorded by
+        _delivery_callback from the shared producer's poll thread.
+        
+        Args:
+            group_details: GroupDetails object to send
+            message_id: Message ID carried in the message payload
+            
+        Raises:
+            KafkaException: If the message cannot be enqueued
+        """
+        # Every field is already validated, so build the wrapper without
+        # re-running validation; to_kafka_message returns encoded bytes.
+        # All fields are passed in declaration order to keep the JSON key
+        # order of the payload unchanged.
+        message = GroupLoadMessage.model_construct(
+            message_type="group_load",
+            timestamp=datetime.utcnow(),
+            environment=config.environment,
+            group_details=group_details,
+            message_id=message_id
+        )
+        value = message.to_kafka_message()
+        key = group_details.group_id.encode('utf-8')
+        
+        while True:
+            try:
+                self.producer.produce(
+                    topic=self.topic,
+                    value=value,
+                    key=key,
+                    callback=partial(self._delivery_callback, message_id=message_id)
+                )
+                break
+            except BufferError:
+                # Local queue is full, serve delivery reports to make room
+                self.producer.poll(0.1)
+    
+    def produce_batch_messages(self, group_details_list: Iterable[GroupDetails]) -> Dict[str, bool]:
         """
         Produce multiple group load messages to Kafka
         
+        Messages are enqueued without blocking and flushed once at the end
+        of the batch.
+        
         Args:
-            group_details_list: List of GroupDetails objects to send
+            group_details_list: GroupDetails objects to send, consumed lazily
             
         Returns:
-            Dict mapping message_id to success status
+            Dict mapping message_id to delivery status
         """
-        results = {}
+        message_ids = []
+        new_ulid = ULID
         
         for group_details in group_details_list:
-            message_id = str(uuid.uuid4())
-            success = self.produce_group_message(group_details, message_id)
-            results[message_id] = success
-            
-        return results
+            message_id = str(new_ulid())
+            message_ids.append(message_id)
+            self._delivery_results[message_id] = False
+            try:
+                self.produce_group_message_async(group_details, message_id)
+            except Exception as e:
+                self.logger.error("Failed to produce message: %s", e)
+        
+        self.producer.flush()
+        
+        return {message_id: self._delivery_results.pop(message_id, False)
+                for message_id in message_ids}
     
-    def _delivery_callback(self, err, msg):
+    def _delivery_callback(self, err, msg, message_id: Optional[str] = None):
         """Callback for message delivery confirmation"""
+        if message_id in self._delivery_results:
+            self._delivery_results[message_id] = err is None
+        
         if err is not None:
-            self.logger.error(f"Message delivery failed: {err}")
-        else:
-            self.logger.debug(f"Message delivered to {msg.topic()} [{msg.partition()}] at offset {msg.offset()}")
+            self.logger.error("Message delivery failed: %s", err)
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Message delivered to %s [%s] at offset %s",
+                              msg.topic(), msg.partition(), msg.offset())
     
     def close(self):
-        """Close the producer"""
+        """
+        Close the producer
+        
+        Waits for queued messages to be delivered; the underlying shared
+        producer stays open for reuse.
+        """
         self.producer.flush()
         self.logger.info("Kafka producer closed")
 
@@ -108,47 +216,90 @@ class GroupLoadStreamer:
     
     def stream_group_data(self, group_data: Dict[str, Any]) -> bool:
         """
-        Stream group data to Kafka
+        Stream group data to Kafka and wait for delivery
         
         Args:
             group_data: Dictionary containing group data
             
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if the message was delivered, False otherwise
         """
         try:
             # Convert dict to GroupDetails model
             group_details = GroupDetails(**group_data)
             
             # Produce to Kafka
-            return self.producer.produce_group_message(group_details)
+            return self.stream_group_model(group_details)
             
         except Exception as e:
-            self.logger.error(f"Failed to stream group data: {str(e)}")
+            self.logger.error("Failed to stream group data: %s", e)
             return False
     
-    def stream_batch_data(self, batch_data: list[Dict[str, Any]]) -> Dict[str, bool]:
+    def stream_group_model(self, group_details: GroupDetails) -> bool:
+        """
+        Stream an already validated group to Kafka and wait for delivery
+        
+        Args:
+            group_details: GroupDetails object to send
+            
+        Returns:
+            bool: True if the message was delivered, False otherwise
+        """
+        results = self.stream_batch_data_models([group_details])
+        return all(success for _, success in results)
+    
+    def stream_batch_data(self, batch_data: Iterable[Dict[str, Any]]) -> List[Tuple[str, bool]]:
         """
         Stream batch group data to Kafka
         
+        Groups are validated and enqueued as they are read from batch_data,
+        which may be a lazy iterator, and flushed once at the end.
+        
         Args:
-            batch_data: List of dictionaries containing group data
+            batch_data: Dictionaries containing group data
             
         Returns:
-            Dict mapping group_id to success status
+            List of (group_id, success) pairs, one per item in batch_data,
+            including items that failed validation
         """
-        results = {}
+        invalid_results = []
         
+        results = self.stream_batch_data_models(self._validate_groups(batch_data, invalid_results))
+                
+        return invalid_results + results
+    
+    def _validate_groups(self, batch_data: Iterable[Dict[str, Any]],
+                         invalid_results: List[Tuple[str, bool]]) -> Iterator[GroupDetails]:
+        """Yield valid groups, recording invalid ones as failed in invalid_results"""
         for group_data in batch_data:
             try:
-                group_details = GroupDetails(**group_data)
-                success = self.producer.produce_group_message(group_details)
-                results[group_details.group_id] = success
+                yield GroupDetails.model_validate(group_data)
             except Exception as e:
-                self.logger.error(f"Failed to process group data: {str(e)}")
-                results[group_data.get('group_id', 'unknown')] = False
-                
-        return results
+                self.logger.error("Failed to process group data: %s", e)
+                invalid_results.append((group_data.get('group_id', 'unknown'), False))
+    
+    def stream_batch_data_models(self, group_details_list: Iterable[GroupDetails]) -> List[Tuple[str, bool]]:
+        """
+        Stream already validated groups to Kafka as a single batch
+        
+        Args:
+            group_details_list: GroupDetails objects to send, consumed lazily
+            
+        Returns:
+            List of (group_id, success) pairs, one per message sent, so
+            groups sharing a group_id are reported separately
+        """
+        group_ids = []
+        
+        def track_group_ids(groups: Iterable[GroupDetails]) -> Iterator[GroupDetails]:
+            for group_details in groups:
+                group_ids.append(group_details.group_id)
+                yield group_details
+        
+        delivery_results = self.producer.produce_batch_messages(track_group_ids(group_details_list))
+        
+        # Delivery results are returned in the order the groups were produced
+        return list(zip(group_ids, delivery_results.values()))
     
     def close(self):
         """Close the streamer"""
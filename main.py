@@ -28,7 +28,7 @@ def main():
         # Example 1: Send predefined sample data
         print("\n1. Sending predefined sample group...")
         sample_group = GroupDetails(**SAMPLE_GROUPS[0])
-        success = streamer.stream_group_data(sample_group.model_dump())
+        success = streamer.stream_group_model(sample_group)
         
         if success:
             print(f"✓ Successfully sent group: {sample_group.group_id}")
@@ -41,7 +41,7 @@ def main():
         generator = GroupDataGenerator()
         random_group = generator.generate_group()
         
-        success = streamer.stream_group_data(random_group.model_dump())
+        success = streamer.stream_group_model(random_group)
         if success:
             print(f"✓ Successfully sent random group: {random_group.group_id}")
             print(f"  - Group Name: {random_group.group_name}")
@@ -55,7 +55,7 @@ def main():
         print("\n3. Generating and sending corporate group...")
         corporate_group = generator.generate_corporate_group("TechCorp Inc", 15)
         
-        success = streamer.stream_group_data(corporate_group.model_dump())
+        success = streamer.stream_group_model(corporate_group)
         if success:
             print(f"✓ Successfully sent corporate group: {corporate_group.group_id}")
             print(f"  - Company: {corporate_group.group_name}")
@@ -1,14 +1,47 @@
 """
 Data models for Group Load Kafka messages
 """
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
-import json
+from typing import Optional, List, Dict, Any, Iterator, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+import orjson
+
+
+# Timestamp shared by all models created inside a frozen_now() block
+_frozen_now: ContextVar[Optional[datetime]] = ContextVar("frozen_now", default=None)
+
+
+def _utcnow() -> datetime:
+    """Current UTC time, or the frozen batch timestamp if one is active"""
+    now = _frozen_now.get()
+    return now if now is not None else datetime.utcnow()
+
+
+@contextmanager
+def frozen_now() -> Iterator[datetime]:
+    """
+    Stamp every model created in this block with the same UTC timestamp
+    
+    Nested blocks reuse the outer timestamp.
+    """
+    now = _frozen_now.get()
+    if now is not None:
+        yield now
+        return
+    
+    token = _frozen_now.set(datetime.utcnow())
+    try:
+        yield _frozen_now.get()
+    finally:
+        _frozen_now.reset(token)
 
 
 class GroupMember(BaseModel):
     """Individual group member information"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+    
     member_id: str = Field(..., description="Unique member identifier")
     first_name: str = Field(..., description="Member first name")
     last_name: str = Field(..., description="Member last name")
@@ -22,6 +55,8 @@ class GroupMember(BaseModel):
 
 class GroupDetails(BaseModel):
     """Group details for Kafka message"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+    
     group_id: str = Field(..., description="Unique group identifier")
     group_name: str = Field(..., description="Group name")
     group_type: str = Field(..., description="Type of group (e.g., corporate, individual)")
@@ -29,35 +64,41 @@ class GroupDetails(BaseModel):
     termination_date: Optional[str] = Field(None, description="Group termination date")
     status: str = Field(default="active", description="Group status")
     members: List[GroupMember] = Field(..., description="List of group members")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Record creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Record update timestamp")
+    created_at: datetime = Field(default_factory=_utcnow, description="Record creation timestamp")
+    updated_at: datetime = Field(default_factory=_utcnow, description="Record update timestamp")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
     
-    def to_kafka_message(self) -> str:
-        """Convert to JSON string for Kafka message"""
-        return self.model_dump_json()
+    def to_kafka_message(self) -> bytes:
+        """Convert to JSON bytes for Kafka message"""
+        return orjson.dumps(self.model_dump())
     
     @classmethod
-    def from_kafka_message(cls, message: str) -> "GroupDetails":
+    def from_kafka_message(cls, message: Union[str, bytes]) -> "GroupDetails":
         """Create GroupDetails from Kafka message JSON"""
-        data = json.loads(message)
+        data = orjson.loads(message)
         return cls(**data)
 
 
 class GroupLoadMessage(BaseModel):
     """Wrapper for group load messages sent to Kafka"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+    
     message_type: str = Field(default="group_load", description="Type of message")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Message timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Message timestamp")
     environment: str = Field(..., description="Target environment (dev/qa)")
     group_details: GroupDetails = Field(..., description="Group details payload")
     message_id: str = Field(..., description="Unique message identifier")
     
-    def to_kafka_message(self) -> str:
-        """Convert to JSON string for Kafka message"""
-        return self.model_dump_json()
+    def to_kafka_message(self) -> bytes:
+        """Convert to JSON bytes for Kafka message"""
+        return orjson.dumps(self.model_dump())
     
     @classmethod
-    def from_kafka_message(cls, message: str) -> "GroupLoadMessage":
+    def from_kafka_message(cls, message: Union[str, bytes]) -> "GroupLoadMessage":
         """Create GroupLoadMessage from Kafka message JSON"""
-        data = json.loads(message)
+        data = orjson.loads(message)
         return cls(**data)
+
+
+# Serializes whole batches of groups in a single pydantic-core call
+GROUPS_ADAPTER = TypeAdapter(List[GroupDetails])
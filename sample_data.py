@@ -1,103 +1,319 @@
 """
 Sample data generators for Group Load Tool
 """
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+import numpy as np
+import orjson
 from faker import Faker
 
-from models import GroupDetails, GroupMember
+from models import GroupDetails, GroupMember, GROUPS_ADAPTER, frozen_now
+
+
+# USPS abbreviations for the 50 states and DC
+US_STATES = (
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "DC", "FL", "GA", "HI", "ID",
+    "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO",
+    "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA",
+    "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+)
+
+ADDRESS_POOL_SIZE = 1000
+ADDRESS_POOL_SEED = 0
+
+PLAN_TYPES = ("HMO", "PPO", "EPO", "POS")
+COVERAGE_LEVELS = ("individual", "family", "employee_plus_spouse")
+
+
+@lru_cache(maxsize=None)
+def _address_pool() -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Street, city and zip code combinations drawn from Faker once per process
+    
+    The pool is seeded with a fixed seed so it is identical in every process.
+    """
+    fake = Faker()
+    fake.seed_instance(ADDRESS_POOL_SEED)
+    return tuple(
+        (fake.street_address(), fake.city(), fake.zipcode())
+        for _ in range(ADDRESS_POOL_SIZE)
+    )
+
+
+def _random_address(rng: random.Random) -> Dict[str, str]:
+    """Pick a sample US address from the precomputed pool"""
+    street, city, zip_code = rng.choice(_address_pool())
+    return {
+        "street": street,
+        "city": city,
+        "state": rng.choice(US_STATES),
+        "zip_code": zip_code,
+        "country": "USA"
+    }
+
+
+def _random_phone(rng: random.Random) -> str:
+    """Generate a sample phone number in the fictional 555 exchange"""
+    return f"+1-555-{rng.randint(0, 9999):04d}"
 
 
 class GroupDataGenerator:
-    """Generate sample group data for testing"""
+    """
+    Generate sample group data for testing
+    
+    Members are built with model_construct since every field is generated
+    here and already known to be valid.
+    """
     
-    def __init__(self):
-        """Initialize the data generator"""
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the data generator
+        
+        Args:
+            seed: Optional seed making the generated data reproducible; it
+                seeds this generator's Faker, random and numpy generators
+        """
         self.fake = Faker()
+        self.random = random.Random()
+        self.reseed(seed)
         self.group_types = ["corporate", "individual", "family", "small_business"]
         self.member_statuses = ["active", "inactive", "pending", "terminated"]
     
+    def reseed(self, seed: Optional[int] = None):
+        """Reseed the Faker, random and numpy generators"""
+        if seed is not None:
+            self.fake.seed_instance(seed)
+        self.random.seed(seed)
+        self.rng = np.random.default_rng(seed)
+    
     def generate_member(self, group_id: str) -> GroupMember:
         """Generate a sample group member"""
-        return GroupMember(
-            member_id=f"{group_id}_M{random.randint(1000, 9999)}",
+        return GroupMember.model_construct(
+            member_id=f"{group_id}_M{self.random.randint(1000, 9999)}",
             first_name=self.fake.first_name(),
             last_name=self.fake.last_name(),
             email=self.fake.email(),
-            phone=self.fake.phone_number(),
+            phone=_random_phone(self.random),
             date_of_birth=self.fake.date_of_birth(minimum_age=18, maximum_age=80).strftime("%Y-%m-%d"),
-            address={
-                "street": self.fake.street_address(),
-                "city": self.fake.city(),
-                "state": self.fake.state_abbr(),
-                "zip_code": self.fake.zipcode(),
-                "country": "USA"
-            },
+            address=_random_address(self.random),
             enrollment_date=self.fake.date_between(start_date="-2y", end_date="today").strftime("%Y-%m-%d"),
-            status=random.choice(self.member_statuses)
+            status=self.random.choice(self.member_statuses)
         )
     
+    def generate_members_bulk(self, group_id: str, count: int) -> List[GroupMember]:
+        """Generate sample group members, drawing each field for all members at once"""
+        fake = self.fake
+        first_name = fake.first_name
+        last_name = fake.last_name
+        email = fake.email
+        date_of_birth = fake.date_of_birth
+        date_between = fake.date_between
+        randint = self.random.randint
+        choose_status = self.random.choice
+        statuses = self.member_statuses
+        construct_member = GroupMember.model_construct
+        
+        first_names = [first_name() for _ in range(count)]
+        last_names = [last_name() for _ in range(count)]
+        emails = [email() for _ in range(count)]
+        phones = [_random_phone(self.random) for _ in range(count)]
+        birth_dates = [date_of_birth(minimum_age=18, maximum_age=80).strftime("%Y-%m-%d") for _ in range(count)]
+        addresses = [_random_address(self.random) for _ in range(count)]
+        enrollment_dates = [date_between(start_date="-2y", end_date="today").strftime("%Y-%m-%d") for _ in range(count)]
+        
+        return [
+            construct_member(
+                member_id=f"{group_id}_M{randint(1000, 9999)}",
+                first_name=first,
+                last_name=last,
+                email=member_email,
+                phone=phone,
+                date_of_birth=dob,
+                address=address,
+                enrollment_date=enrolled,
+                status=choose_status(statuses)
+            )
+            for first, last, member_email, phone, dob, address, enrolled in zip(
+                first_names, last_names, emails, phones, birth_dates, addresses, enrollment_dates
+            )
+        ]
+    
     def generate_group(self, group_id: Optional[str] = None) -> GroupDetails:
         """Generate a sample group"""
         if not group_id:
-            group_id = f"GRP_{random.randint(10000, 99999)}"
+            group_id = f"GRP_{self.random.randint(10000, 99999)}"
         
-        # Generate random number of members (1-50)
-        num_members = random.randint(1, 50)
-        members = [self.generate_member(group_id) for _ in range(num_members)]
+        return self._generate_group_from_draws(
+            group_id,
+            num_members=self.random.randint(1, 50),
+            terminated=self.random.random() < 0.1,  # 10% chance of terminated group
+            group_type=self.random.choice(self.group_types),
+            plan_type=self.random.choice(PLAN_TYPES),
+            coverage_level=self.random.choice(COVERAGE_LEVELS),
+            premium_amount=round(self.random.uniform(200, 2000), 2),
+            deductible=self.random.randint(500, 5000),
+            max_out_of_pocket=self.random.randint(1000, 10000)
+        )
+    
+    def _generate_group_from_draws(self, group_id: str, num_members: int, terminated: bool,
+                                   group_type: str, plan_type: str, coverage_level: str,
+                                   premium_amount: float, deductible: int,
+                                   max_out_of_pocket: int) -> GroupDetails:
+        """Generate a sample group from pre-drawn random values"""
+        members = self.generate_members_bulk(group_id, num_members)
         
         # Generate group dates
         effective_date = self.fake.date_between(start_date="-1y", end_date="today")
         termination_date = None
-        if random.random() < 0.1:  # 10% chance of terminated group
+        if terminated:
             termination_date = self.fake.date_between(start_date=effective_date, end_date="today")
         
         return GroupDetails(
             group_id=group_id,
             group_name=f"{self.fake.company()} Group Plan",
-            group_type=random.choice(self.group_types),
+            group_type=group_type,
             effective_date=effective_date.strftime("%Y-%m-%d"),
             termination_date=termination_date.strftime("%Y-%m-%d") if termination_date else None,
             status="active" if not termination_date else "terminated",
             members=members,
             metadata={
-                "plan_type": random.choice(["HMO", "PPO", "EPO", "POS"]),
-                "coverage_level": random.choice(["individual", "family", "employee_plus_spouse"]),
-                "premium_amount": round(random.uniform(200, 2000), 2),
-                "deductible": random.randint(500, 5000),
-                "max_out_of_pocket": random.randint(1000, 10000)
+                "plan_type": plan_type,
+                "coverage_level": coverage_level,
+                "premium_amount": premium_amount,
+                "deductible": deductible,
+                "max_out_of_pocket": max_out_of_pocket
             }
         )
     
     def generate_batch_groups(self, count: int) -> List[GroupDetails]:
-        """Generate a batch of sample groups"""
-        return [self.generate_group() for _ in range(count)]
+        """
+        Generate a batch of sample groups
+        
+        The per-group random values are drawn for the whole batch at once
+        with numpy and converted to plain Python values.
+        """
+        rng = self.rng
+        group_types = self.group_types
+        
+        group_ids = rng.integers(10000, 100000, count).tolist()
+        num_members = rng.integers(1, 51, count).tolist()
+        terminated = (rng.random(count) < 0.1).tolist()
+        group_type_idx = rng.integers(0, len(group_types), count).tolist()
+        plan_type_idx = rng.integers(0, len(PLAN_TYPES), count).tolist()
+        coverage_level_idx = rng.integers(0, len(COVERAGE_LEVELS), count).tolist()
+        premiums = np.round(rng.uniform(200, 2000, count), 2).tolist()
+        deductibles = rng.integers(500, 5001, count).tolist()
+        max_out_of_pockets = rng.integers(1000, 10001, count).tolist()
+        
+        with frozen_now():
+            return [
+                self._generate_group_from_draws(
+                    f"GRP_{group_ids[i]}",
+                    num_members=num_members[i],
+                    terminated=terminated[i],
+                    group_type=group_types[group_type_idx[i]],
+                    plan_type=PLAN_TYPES[plan_type_idx[i]],
+                    coverage_level=COVERAGE_LEVELS[coverage_level_idx[i]],
+                    premium_amount=premiums[i],
+                    deductible=deductibles[i],
+                    max_out_of_pocket=max_out_of_pockets[i]
+                )
+                for i in range(count)
+            ]
+    
+    def generate_batch_groups_parallel(self, count: int, workers: Optional[int] = None,
+                                       executor: Optional[ProcessPoolExecutor] = None) -> List[GroupDetails]:
+        """
+        Generate a batch of sample groups across multiple processes
+        
+        Worker output is trusted, so groups are rebuilt with model_construct
+        instead of being validated again. Pass an executor from
+        create_generator_pool to reuse one pool across calls; otherwise a
+        pool is created for this call.
+        """
+        groups = []
+        for chunk in self._generate_chunks_parallel(count, workers, executor=executor):
+            groups.extend(_construct_group(group_data) for group_data in orjson.loads(chunk))
+        
+        return groups
+    
+    def generate_batch_groups_parallel_json(self, count: int, workers: Optional[int] = None,
+                                            indent: Optional[int] = None) -> bytes:
+        """
+        Generate a batch of sample groups across multiple processes as a JSON array
+        
+        The workers' JSON chunks are concatenated directly, without being
+        decoded in this process.
+        """
+        chunks = [chunk for chunk in self._generate_chunks_parallel(count, workers, indent) if chunk != b"[]"]
+        if not chunks:
+            return b"[]"
+        
+        # Strip each chunk's enclosing brackets (and the newlines indent adds)
+        trim = 2 if indent is not None else 1
+        separator = b",\n" if indent is not None else b","
+        body = separator.join(chunk[trim:-trim] for chunk in chunks)
+        return b"[\n" + body + b"\n]" if indent is not None else b"[" + body + b"]"
+    
+    def _generate_chunks_parallel(self, count: int, workers: Optional[int] = None,
+                                  indent: Optional[int] = None,
+                                  executor: Optional[ProcessPoolExecutor] = None) -> Iterator[bytes]:
+        """
+        Generate groups in worker processes, yielding each chunk as JSON bytes
+        
+        Each worker reseeds its generator from a seed drawn here and returns
+        its chunk as JSON bytes to keep inter-process transfer cheap.
+        """
+        workers = min(workers or os.cpu_count() or 1, max(count, 1))
+        chunk_sizes = [count // workers + (1 if i < count % workers else 0) for i in range(workers)]
+        seeds = [self.random.randrange(2**32) for _ in chunk_sizes]
+        
+        indents = [indent] * workers
+        
+        if executor is not None:
+            yield from executor.map(_generate_group_chunk, chunk_sizes, seeds, indents)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(_generate_group_chunk, chunk_sizes, seeds, indents)
     
     def generate_corporate_group(self, company_name: str, num_employees: int) -> GroupDetails:
         """Generate a specific corporate group"""
-        group_id = f"CORP_{company_name.upper().replace(' ', '_')}_{random.randint(1000, 9999)}"
+        group_id = f"CORP_{company_name.upper().replace(' ', '_')}_{self.random.randint(1000, 9999)}"
+        
+        # Hoist loop invariants and provider lookups out of the member loop
+        fake = self.fake
+        first_name = fake.first_name
+        last_name = fake.last_name
+        date_of_birth = fake.date_of_birth
+        date_between = fake.date_between
+        construct_member = GroupMember.model_construct
+        domain = company_name.lower().replace(' ', '') + ".com"
+        member_id_fmt = f"{group_id}_EMP{{:04d}}".format
+        
+        first_names = [first_name() for _ in range(num_employees)]
+        last_names = [last_name() for _ in range(num_employees)]
         
         members = []
+        append_member = members.append
         for i in range(num_employees):
-            member = GroupMember(
-                member_id=f"{group_id}_EMP{i+1:04d}",
-                first_name=self.fake.first_name(),
-                last_name=self.fake.last_name(),
-                email=f"{self.fake.first_name().lower()}.{self.fake.last_name().lower()}@{company_name.lower().replace(' ', '')}.com",
-                phone=self.fake.phone_number(),
-                date_of_birth=self.fake.date_of_birth(minimum_age=22, maximum_age=65).strftime("%Y-%m-%d"),
-                address={
-                    "street": self.fake.street_address(),
-                    "city": self.fake.city(),
-                    "state": self.fake.state_abbr(),
-                    "zip_code": self.fake.zipcode(),
-                    "country": "USA"
-                },
-                enrollment_date=self.fake.date_between(start_date="-1y", end_date="today").strftime("%Y-%m-%d"),
+            first = first_names[i]
+            last = last_names[i]
+            append_member(construct_member(
+                member_id=member_id_fmt(i + 1),
+                first_name=first,
+                last_name=last,
+                email=f"{first.lower()}.{last.lower()}@{domain}",
+                phone=_random_phone(self.random),
+                date_of_birth=date_of_birth(minimum_age=22, maximum_age=65).strftime("%Y-%m-%d"),
+                address=_random_address(self.random),
+                enrollment_date=date_between(start_date="-1y", end_date="today").strftime("%Y-%m-%d"),
                 status="active"
-            )
-            members.append(member)
+            ))
         
         return GroupDetails(
             group_id=group_id,
@@ -110,15 +326,52 @@ class GroupDataGenerator:
             metadata={
                 "plan_type": "PPO",
                 "coverage_level": "employee_plus_family",
-                "premium_amount": round(random.uniform(800, 1500), 2),
-                "deductible": random.randint(1000, 3000),
-                "max_out_of_pocket": random.randint(2000, 8000),
+                "premium_amount": round(self.random.uniform(800, 1500), 2),
+                "deductible": self.random.randint(1000, 3000),
+                "max_out_of_pocket": self.random.randint(2000, 8000),
                 "company_size": num_employees,
-                "industry": random.choice(["Technology", "Healthcare", "Finance", "Manufacturing", "Retail"])
+                "industry": self.random.choice(["Technology", "Healthcare", "Finance", "Manufacturing", "Retail"])
             }
         )
 
 
+def create_generator_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool for generate_batch_groups_parallel
+    
+    All worker processes are started before this returns. Create the pool
+    before any Kafka producer exists, since librdkafka is not fork-safe.
+    """
+    executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+    # The first task starts every worker when the pool forks
+    executor.submit(int).result()
+    return executor
+
+
+# Generator reused across chunks within a worker process
+_worker_generator: Optional[GroupDataGenerator] = None
+
+
+def _generate_group_chunk(count: int, seed: int, indent: Optional[int] = None) -> bytes:
+    """Generate a chunk of groups in a worker process, serialized to JSON"""
+    global _worker_generator
+    
+    if _worker_generator is None:
+        _worker_generator = GroupDataGenerator()
+    generator = _worker_generator
+    generator.reseed(seed)
+    return GROUPS_ADAPTER.dump_json(generator.generate_batch_groups(count), indent=indent)
+
+
+def _construct_group(group_data: Dict[str, Any]) -> GroupDetails:
+    """Rebuild a group dumped by a generator worker without validating it again"""
+    construct_member = GroupMember.model_construct
+    group_data["members"] = [construct_member(**member) for member in group_data["members"]]
+    group_data["created_at"] = datetime.fromisoformat(group_data["created_at"])
+    group_data["updated_at"] = datetime.fromisoformat(group_data["updated_at"])
+    return GroupDetails.model_construct(**group_data)
+
+
 # Sample data for immediate use
 SAMPLE_GROUPS = [
     {